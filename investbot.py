@@ -4,53 +4,434 @@
 # Cursor Git integration test - WORKING! 🚀
 
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import json
+import functools
+import hashlib
+import pickle
 from datetime import datetime, timedelta, date
+from datetime import time as dtime
 import pytz
 import os
 import time
-import schedule
+import sqlite3
+import threading
 import xml.etree.ElementTree as ET
 import re
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, ClassVar, Dict, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    import orjson
+    _loads: Callable[[bytes], Dict] = orjson.loads
+except ImportError:
+    _loads = json.loads
+from investbot_cache import cached, FileCache
+
+# Baselines for the cheap pre-scan probe (EDGAR Last-Modified, etc.)
+_probe_cache = FileCache()
 import finnhub
+import numpy as np
+
+try:
+    import websocket  # optional: live quote streaming (pip install websocket-client)
+    WEBSOCKET_AVAILABLE = True
+except ImportError:
+    WEBSOCKET_AVAILABLE = False
+
+# Shared HTTP session: keep-alive + pooled connections so we pay the TLS
+# handshake once per host instead of once per request. Transient failures
+# (and 429s, honoring Retry-After) retry at the adapter level with
+# exponential backoff instead of surfacing as a failed scan
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16, pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True)
+))
+
+class _RateLimiter:
+    """Token bucket: acquire() blocks only as long as needed to stay under rate_per_sec."""
+
+    def __init__(self, rate_per_sec: float, capacity: Optional[float] = None):
+        self.rate = rate_per_sec
+        self.capacity = capacity if capacity is not None else rate_per_sec
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+
+# SEC fair-access limit is 10 requests/second
+_SEC_RATE_LIMITER = _RateLimiter(10)
+# Finnhub free tier allows 30 requests/second
+_FINNHUB_RATE_LIMITER = _RateLimiter(30)
+# Telegram caps bots at ~30 messages/second globally; 25 leaves headroom
+# so a burst of alerts never trips a 429 and its 1-60s retry_after penalty
+_TELEGRAM_RATE_LIMITER = _RateLimiter(25, capacity=25)
 
 # --- STATE MANAGEMENT ---
-STATE_FILE = "sent_alerts.log"
-sent_alerts_cache = set()
+STATE_FILE = "sent_alerts.log"  # legacy text log, migrated into ALERTS_DB on first run
+ALERTS_DB = "alerts.db"
+BLOOM_FILE = "alerts.bloom"  # pickled Bloom sidecar, rebuilt from the DB if missing
 
-def load_sent_alerts():
-    """Load the log of sent alerts from the state file into memory."""
-    try:
-        if os.path.exists(STATE_FILE):
+def _key_hash(alert_key: str) -> int:
+    """64-bit digest of an alert key, stable across runs and processes.
+
+    Alert keys average 30-60 bytes of string each and the log keeps them
+    forever; an 8-byte int is what actually gets stored and compared.
+    At a million keys the collision odds are ~1e-7, and a collision only
+    suppresses one duplicate-looking alert - acceptable for a dedup log.
+
+    Interpreted signed because SQLite INTEGER binds are signed 64-bit;
+    an unsigned read overflows on roughly half of all digests.
+    """
+    return int.from_bytes(hashlib.blake2b(alert_key.encode(), digest_size=8).digest(), 'little', signed=True)
+
+class _BloomFilter:
+    """Fixed-size Bloom filter sized for ~1M alert keys at ~1e-6 false positives.
+
+    Sits in front of the SQLite alerts table as a negative cache: ~2 bits/key
+    of memory, and a miss (the overwhelmingly common case for new alerts)
+    costs a few hashes instead of a disk query. A false positive only means
+    one extra SELECT - never a wrongly suppressed alert.
+    """
+
+    VERSION: ClassVar[int] = 2  # bumped when the key format changes (v2: 64-bit int digests)
+
+    def __init__(self, num_bits: int = 1 << 25, num_hashes: int = 20):
+        self.version = self.VERSION
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self.bits = bytearray(num_bits // 8)
+
+    def _indexes(self, key: int):
+        digest = hashlib.blake2b(key.to_bytes(8, 'little', signed=True), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: int):
+        for idx in self._indexes(key):
+            self.bits[idx >> 3] |= 1 << (idx & 7)
+
+    def __contains__(self, key: int) -> bool:
+        return all(self.bits[idx >> 3] & (1 << (idx & 7)) for idx in self._indexes(key))
+
+class AlertStore:
+    """SQLite-backed sent-alerts log.
+
+    Membership checks are single indexed lookups instead of loading (and
+    rewriting) the whole history file on every run, so memory and startup
+    cost stay constant no matter how long the bot has been running.
+    """
+
+    def __init__(self, path: str = ALERTS_DB):
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        # WAL lets the worker threads read while a flush commits, and
+        # NORMAL drops the per-commit fsync (a crash can lose the last
+        # flush, which just means one re-sent alert)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS alerts (alert_key TEXT PRIMARY KEY, ts REAL)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        self.conn.commit()
+        # Re-key first so the legacy import below lands its digests in the
+        # INTEGER-keyed table rather than being stringified and re-hashed
+        self._migrate_to_hashed_keys()
+        self._migrate_legacy_log()
+        self.bloom = self._load_bloom()
+        # Marks made this run, buffered and written in one batch on flush
+        self._pending: List[Tuple[int, float]] = []
+        self._pending_keys: Set[int] = set()
+
+    def _load_bloom(self) -> _BloomFilter:
+        """Load the pickled Bloom sidecar, or rebuild it from the alerts table.
+
+        Unpickling the bit array is one C-level read; the fallback rescan
+        re-hashes every stored key and grows linearly with history, so it
+        only happens on first run or after a corrupted sidecar.
+        """
+        try:
+            with open(BLOOM_FILE, 'rb') as f:
+                bloom = pickle.load(f)
+            if isinstance(bloom, _BloomFilter) and getattr(bloom, 'version', 0) == _BloomFilter.VERSION:
+                return bloom
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"⚠️ Could not load Bloom sidecar ({e}) - rebuilding from {ALERTS_DB}")
+        bloom = _BloomFilter()
+        with self._lock:
+            for (key,) in self.conn.execute("SELECT alert_key FROM alerts"):
+                bloom.add(key)
+        self._save_bloom(bloom)
+        return bloom
+
+    def _save_bloom(self, bloom: Optional[_BloomFilter] = None):
+        if bloom is None:
+            bloom = self.bloom
+        try:
+            with open(BLOOM_FILE, 'wb') as f:
+                pickle.dump(bloom, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            print(f"⚠️ Could not save Bloom sidecar: {e}")
+
+    def _migrate_legacy_log(self):
+        """One-time import of the old line-per-key text log."""
+        if not os.path.exists(STATE_FILE):
+            return
+        try:
             with open(STATE_FILE, 'r') as f:
-                for line in f:
-                    sent_alerts_cache.add(line.strip())
-        print(f"✅ Loaded {len(sent_alerts_cache)} previously sent alerts from {STATE_FILE}.")
-    except Exception as e:
-        print(f"⚠️ Could not load state file: {e}")
+                keys = [(_key_hash(line.strip()), time.time()) for line in f if line.strip()]
+            with self._lock:
+                self.conn.executemany("INSERT OR IGNORE INTO alerts VALUES (?, ?)", keys)
+                self.conn.commit()
+            os.rename(STATE_FILE, STATE_FILE + ".migrated")
+            print(f"✅ Migrated {len(keys)} alert keys from {STATE_FILE} into {ALERTS_DB}.")
+        except Exception as e:
+            print(f"⚠️ Could not migrate legacy state file: {e}")
+
+    def _migrate_to_hashed_keys(self):
+        """One-time rewrite of stored text keys as 64-bit integer digests.
+
+        Runs as a single transaction: rename the old table aside, rebuild
+        it INTEGER-keyed, and only commit once the re-insert and the
+        key-format marker both succeeded - any failure rolls back to the
+        untouched original table.
+        """
+        if self.get_meta('key-format') == 'hash64':
+            return
+        hashed = []
+        try:
+            with self._lock:
+                rows = self.conn.execute("SELECT alert_key, ts FROM alerts").fetchall()
+                self.conn.execute("ALTER TABLE alerts RENAME TO alerts_legacy")
+                self.conn.execute("CREATE TABLE alerts (alert_key INTEGER PRIMARY KEY, ts REAL)")
+                hashed = [(_key_hash(k), ts) for k, ts in rows if isinstance(k, str)]
+                self.conn.executemany("INSERT OR IGNORE INTO alerts VALUES (?, ?)", hashed)
+                self.conn.execute("DROP TABLE alerts_legacy")
+                self.conn.execute("INSERT OR REPLACE INTO meta VALUES ('key-format', 'hash64')")
+                self.conn.commit()
+            if hashed:
+                print(f"✅ Re-keyed {len(hashed)} stored alerts as 64-bit digests.")
+        except Exception as e:
+            self.conn.rollback()
+            print(f"⚠️ Could not re-key alert store: {e}")
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM alerts").fetchone()[0]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Read a small piece of bot metadata (HTTP cursors, baselines)."""
+        with self._lock:
+            row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+            return row[0] if row else None
+
+    def set_meta(self, key: str, value: str):
+        with self._lock:
+            self.conn.execute("INSERT OR REPLACE INTO meta VALUES (?, ?)", (key, value))
+            self.conn.commit()
+
+    def seen(self, alert_key: str) -> bool:
+        key = _key_hash(alert_key)
+        if key not in self.bloom:
+            return False  # definite miss, skip the disk query
+        if key in self._pending_keys:
+            return True
+        with self._lock:
+            cur = self.conn.execute("SELECT 1 FROM alerts WHERE alert_key = ? LIMIT 1", (key,))
+            return cur.fetchone() is not None
+
+    def mark(self, alert_key: str):
+        key = _key_hash(alert_key)
+        self.bloom.add(key)
+        with self._lock:
+            self._pending.append((key, time.time()))
+            self._pending_keys.add(key)
+
+    def flush(self) -> int:
+        """Write all marks from this run in a single batched transaction.
+
+        Returns how many keys were written; zero means the store was clean
+        and no disk work happened (no commit, no sidecar rewrite).
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+            written = len(self._pending)
+            self.conn.executemany("INSERT OR IGNORE INTO alerts VALUES (?, ?)", self._pending)
+            self.conn.commit()
+            self._pending.clear()
+            self._pending_keys.clear()
+        # Keep the sidecar in step with the table so the next startup
+        # skips the rebuild scan
+        self._save_bloom()
+        return written
+
+_alert_store: Optional[AlertStore] = None
+_alert_store_lock = threading.Lock()
+
+def _get_store() -> AlertStore:
+    # Double-checked lock: first touch can come from concurrent worker
+    # threads (both check methods run in an executor), and two stores
+    # racing the open would run the re-key migration against the same file
+    global _alert_store
+    if _alert_store is None:
+        with _alert_store_lock:
+            if _alert_store is None:
+                _alert_store = AlertStore()
+    return _alert_store
+
+@functools.lru_cache(maxsize=1)
+def load_sent_alerts():
+    """Kept for the old file-loading call sites; the store itself is lazy.
+
+    The SQLite connect, legacy migration and Bloom warm are all deferred
+    to the first membership check, so runs that bail out early (quiet-day
+    probes, missing credentials) never pay the open cost at all.
+    """
+    print(f"✅ Alert store ready ({ALERTS_DB} opens on first check).")
 
 def save_sent_alerts():
-    """Save the in-memory cache of sent alerts back to the state file."""
+    """Flush the sent-alerts store (writes happen incrementally as alerts fire)."""
+    if _alert_store is None:
+        return  # store was never opened this run - nothing to flush
     try:
-        with open(STATE_FILE, 'w') as f:
-            for alert_key in sorted(list(sent_alerts_cache)):
-                f.write(f"{alert_key}\n")
-        print(f"✅ Saved {len(sent_alerts_cache)} alert keys to {STATE_FILE}.")
+        store = _get_store()
+        written = store.flush()
+        if not written:
+            return  # nothing marked since the last flush - skip the disk work
+        print(f"✅ Alert store flushed (+{written} new, {store.count()} alert keys in {ALERTS_DB}).")
+        load_sent_alerts.cache_clear()
     except Exception as e:
-        print(f"❌ Failed to save state file: {e}")
+        print(f"❌ Failed to save alert state: {e}")
+
+# Fields that change between otherwise-identical alerts and must not
+# affect the payload fingerprint
+VOLATILE_FIELDS = ('alert_key', 'current_price', 'previous_close', 'change_amount')
+
+def _fingerprint(payload) -> str:
+    """MD5 fingerprint of a normalized alert payload (dict or NamedTuple record).
+
+    Volatile fields are dropped and floats rounded so the same logical
+    alert always hashes to the same value - dedup becomes one dict lookup.
+    """
+    if hasattr(payload, '_asdict'):
+        payload = payload._asdict()
+    stable = {
+        k: (round(v, 1) if isinstance(v, float) else v)
+        for k, v in payload.items() if k not in VOLATILE_FIELDS
+    }
+    return hashlib.md5(json.dumps(stable, sort_keys=True).encode()).hexdigest()
 
 def has_alert_been_sent(alert_key: str) -> bool:
     """Check if a specific alert has already been sent."""
-    return alert_key in sent_alerts_cache
+    return _get_store().seen(alert_key)
 
 def mark_alert_as_sent(alert_key: str):
-    """Add a new alert key to our in-memory cache."""
-    sent_alerts_cache.add(alert_key)
+    """Record a new alert key in the store."""
+    _get_store().mark(alert_key)
+
+# Ticker ↔ company-name maps, built once at import instead of per call;
+# TICKER_OF is derived from COMPANY_NAMES plus the entries that only
+# exist in the reverse direction
+COMPANY_NAMES = {
+    'AAPL': 'Apple Inc.', 'MSFT': 'Microsoft Corporation', 'GOOGL': 'Alphabet Inc.', 'GOOG': 'Alphabet Inc.', 'AMZN': 'Amazon.com Inc.', 'TSLA': 'Tesla Inc.', 'NVDA': 'NVIDIA Corporation', 'META': 'Meta Platforms Inc.', 'BRK-B': 'Berkshire Hathaway', 'JPM': 'JPMorgan Chase & Co.', 'JNJ': 'Johnson & Johnson', 'PG': 'Procter & Gamble', 'HD': 'The Home Depot', 'BAC': 'Bank of America', 'UNH': 'UnitedHealth Group', 'V': 'Visa Inc.', 'MA': 'Mastercard Inc.', 'WMT': 'Walmart Inc.', 'DIS': 'The Walt Disney Company', 'NFLX': 'Netflix Inc.', 'CRM': 'Salesforce Inc.', 'ADBE': 'Adobe Inc.', 'ORCL': 'Oracle Corporation', 'CSCO': 'Cisco Systems', 'INTC': 'Intel Corporation', 'AMD': 'Advanced Micro Devices', 'QCOM': 'QUALCOMM Inc.', 'TXN': 'Texas Instruments', 'AVGO': 'Broadcom Inc.', 'HON': 'Honeywell International', 'CAT': 'Caterpillar Inc.', 'BA': 'The Boeing Company', 'GE': 'General Electric', 'MMM': '3M Company', 'KO': 'The Coca-Cola Company', 'PEP': 'PepsiCo Inc.', 'MCD': 'McDonald\'s Corporation', 'NKE': 'NIKE Inc.', 'SBUX': 'Starbucks Corporation'
+}
+TICKER_OF = {name: ticker for ticker, name in COMPANY_NAMES.items()}
+TICKER_OF.update({
+    'Alphabet Inc.': 'GOOGL',  # prefer the class-A listing over GOOG
+    'Chevron Corp': 'CVX', 'Occidental Petroleum': 'OXY', 'Activision Blizzard': 'ATVI',
+    'Wells Fargo & Co': 'WFC', 'Verizon Communications': 'VZ', 'Exxon Mobil': 'XOM',
+    'ConocoPhillips': 'COP'
+})
+
+# SEC form types worth alerting on, as a frozenset for O(1) membership
+# tests in the filing loops
+TRACKED_FORMS = frozenset({'13F-HR', '13F-NT', '4', 'SC 13G', 'SC 13D', '8-K'})
+
+# Watchlist for the price scan, built once at import instead of as a
+# 38-element list literal on every check_major_price_moves call
+MAJOR_TICKERS = ('AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B', 'JPM', 'V', 'MA', 'UNH', 'JNJ', 'PG', 'HD', 'BAC', 'WMT', 'DIS', 'NFLX', 'CRM', 'ADBE', 'ORCL', 'CSCO', 'INTC', 'AMD', 'QCOM', 'TXN', 'AVGO', 'HON', 'CAT', 'BA', 'GE', 'MMM', 'KO', 'PEP', 'MCD', 'NKE', 'SBUX')
+# Surface missing name mappings at import time, not mid-alert
+for _ticker in MAJOR_TICKERS:
+    if _ticker not in COMPANY_NAMES:
+        print(f"⚠️ {_ticker} is in MAJOR_TICKERS but has no COMPANY_NAMES entry")
+
+# Alert records: NamedTuples instead of dicts - smaller per-instance
+# footprint and faster attribute access when scanning many candidates
+class Filing(NamedTuple):
+    trader: str
+    company: str
+    form: str
+    date: str
+    strategy: str
+    whale_link: str
+    accession_number: str
+    cik: str
+    alert_key: str
+
+class Move(NamedTuple):
+    ticker: str
+    company_name: str
+    current_price: float
+    previous_close: float
+    change_pct: float
+    change_amount: float
+    alert_key: str
+    threshold: float
+    abs_pct: float  # computed once at construction; sorting/urgency reuse it
+
+class HealthStatus(NamedTuple):
+    finnhub_ok: bool
+    telegram_ok: bool
+    latency_ms: float
+
+# Urgency tiers, indexed via bisect on the move's absolute change:
+# <5% MEDIUM, 5-10% HIGH, >=10% CRITICAL
+URGENCY_THRESHOLDS = (5.0, 10.0)
+URGENCY_LABELS = ('MEDIUM', 'HIGH', 'CRITICAL')
+URGENCY_ICONS = ('⚠️', '🚨', '🚨🚨🚨')
+
+# Alert templates, compiled once at import instead of being rebuilt
+# inside the formatters on every alert
+_FILING_TMPL = (
+    "👤 *{trader}*\n🏢 {company}\n📄 {form} filed on {date}\n🎯 Strategy: _{strategy}_\n\n"
+    "🔗 *Analysis:*\n🐋 [WhaleWisdom]({whale_link})\n📊 [QuiverQuant](https://www.quiverquant.com/sources/institutions)\n\n"
+    "─────────────────\n\n"
+)
+_MOVE_TMPL = (
+    "{urgency} {direction} *{ticker}* - {company_name}\n"
+    "💰 Price: ${current_price:.2f} (was ${previous_close:.2f})\n"
+    "📊 Change: {change_pct:+.2f}% (${change_amount:+.2f})\n"
+    "🎯 Threshold: {threshold:.1f}%\n\n"
+)
 
 class MarketHours:
     """Handle market hours and trading sessions"""
-    
+
+    # Session boundaries (Eastern) - constants, so no strptime on hot paths
+    PRE_OPEN = dtime(4, 0)
+    OPEN = dtime(9, 30)
+    CLOSE = dtime(16, 0)
+    AFTER_CLOSE = dtime(20, 0)
+    SUMMARY_START = dtime(16, 30)
+    SUMMARY_END = dtime(17, 0)
+
     def __init__(self):
         self.eastern = pytz.timezone('US/Eastern')
         
@@ -67,24 +448,26 @@ class MarketHours:
             datetime(2025, 11, 27), # Thanksgiving
             datetime(2025, 12, 25), # Christmas
         ]
+        # O(1) lookups instead of rebuilding a date list per check
+        self.holiday_dates = frozenset(holiday.date() for holiday in self.market_holidays)
     
     def get_current_time_eastern(self) -> datetime:
         """Get current time in Eastern timezone"""
         return datetime.now(self.eastern)
     
-    def is_market_holiday(self, date: datetime = None) -> bool:
+    def is_market_holiday(self, date: Optional[datetime] = None) -> bool:
         """Check if given date is a market holiday"""
         if date is None:
             date = self.get_current_time_eastern()
-        return date.date() in [holiday.date() for holiday in self.market_holidays]
+        return date.date() in self.holiday_dates
     
-    def is_weekend(self, date: datetime = None) -> bool:
+    def is_weekend(self, date: Optional[datetime] = None) -> bool:
         """Check if given date is weekend"""
         if date is None:
             date = self.get_current_time_eastern()
         return date.weekday() >= 5  # Saturday = 5, Sunday = 6
     
-    def get_market_session(self, dt: datetime = None) -> str:
+    def get_market_session(self, dt: Optional[datetime] = None) -> str:
         """Determine current market session"""
         if dt is None:
             dt = self.get_current_time_eastern()
@@ -94,40 +477,58 @@ class MarketHours:
         
         time_only = dt.time()
         
-        if time_only < datetime.strptime('04:00', '%H:%M').time():
+        if time_only < self.PRE_OPEN:
             return 'closed'
-        elif time_only < datetime.strptime('09:30', '%H:%M').time():
+        elif time_only < self.OPEN:
             return 'pre_market'
-        elif time_only < datetime.strptime('16:00', '%H:%M').time():
+        elif time_only < self.CLOSE:
             return 'regular'
-        elif time_only < datetime.strptime('20:00', '%H:%M').time():
+        elif time_only < self.AFTER_CLOSE:
             return 'after_hours'
         else:
             return 'closed'
     
+    SESSION_EMOJIS = {
+        'closed': '🌙',
+        'pre_market': '🌅',
+        'regular': '📈',
+        'after_hours': '🌆'
+    }
+
     def get_session_emoji(self) -> str:
         """Get emoji for current market session"""
         session = self.get_market_session()
-        emojis = {
-            'closed': '🌙',
-            'pre_market': '🌅',
-            'regular': '📈',
-            'after_hours': '🌆'
-        }
-        return emojis.get(session, '❓')
+        return self.SESSION_EMOJIS.get(session, '❓')
+
+    def snapshot(self) -> Tuple[datetime, str, str]:
+        """One (now, session, emoji) tuple from a single tz-aware now().
+
+        Callers that need the session more than once per tick (monitoring
+        run, each alert it sends) take one snapshot and pass it down
+        instead of re-running the holiday/weekend checks per call.
+        """
+        now = self.get_current_time_eastern()
+        session = self.get_market_session(now)
+        return now, session, self.SESSION_EMOJIS.get(session, '❓')
     
     def is_end_of_trading_day(self) -> bool:
         """Check if it's time for daily summary"""
         now = self.get_current_time_eastern()
         if self.is_weekend(now) or self.is_market_holiday(now):
             return False
-        return now.time() >= datetime.strptime('16:30', '%H:%M').time() and now.time() <= datetime.strptime('17:00', '%H:%M').time()
+        return self.SUMMARY_START <= now.time() <= self.SUMMARY_END
 
 class VIPInvestBot:
-    def __init__(self):
+    def __init__(self, token: Optional[str] = None, chat_id: Optional[str] = None,
+                 finnhub_key: Optional[str] = None):
+        # Credentials can be injected by callers that already validated
+        # them (test_bot) so the constructor doesn't re-read os.environ
         self.market = MarketHours()
-        self.bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-        self.chat_id = os.getenv('TELEGRAM_CHAT_ID')
+        self.bot_token = token or os.getenv('TELEGRAM_BOT_TOKEN')
+        self.chat_id = chat_id or os.getenv('TELEGRAM_CHAT_ID')
+        # TELEGRAM_CHAT_ID may be a comma-separated list of destinations;
+        # each gets its own concurrent send and its own 429 backoff
+        self.chat_ids = [c.strip() for c in (self.chat_id or '').split(',') if c.strip()]
         self.daily_summary_sent_key = f"summary-{date.today().strftime('%Y-%m-%d')}"
 
         self.headers = {
@@ -135,7 +536,39 @@ class VIPInvestBot:
             'Accept-Encoding': 'gzip, deflate',
             'Host': 'data.sec.gov'
         }
-        
+        self.index_headers = {
+            'User-Agent': 'VIPInvestBot Professional',
+            'Accept-Encoding': 'gzip, deflate',
+            'Host': 'www.sec.gov'
+        }
+        # All SEC traffic goes through the shared pooled session
+        self.session = _SESSION
+
+        # One finnhub client for the bot's lifetime - constructing it
+        # per call rebuilt a fresh Session (no connection reuse) each time
+        self.finnhub_key = finnhub_key or os.getenv('FINNHUB_API_KEY')
+        self.finnhub_client = finnhub.Client(api_key=self.finnhub_key) if self.finnhub_key else None
+        # Set once the multi-symbol quote request gets rejected, so every
+        # later scan goes straight to the per-symbol fan-out
+        self._multi_quote_unsupported = False
+        # Baseline observed by quick_probe, committed only after the gated
+        # scan actually succeeds (see commit_probe_baseline)
+        self._pending_index_baseline = None
+
+        # Persistent session for Telegram so back-to-back alerts reuse the
+        # keep-alive connection instead of paying a TLS handshake each time
+        self.telegram_session = requests.Session()
+
+        # Optional live price stream: with websocket-client installed and
+        # FINNHUB_STREAMING=1, trades arrive over one socket and the price
+        # scan overlays them on the REST quotes instead of waiting for the
+        # next batch fetch
+        self.latest_price: Dict[str, Tuple[float, float]] = {}
+        self._ws = None
+        if WEBSOCKET_AVAILABLE and self.finnhub_key and os.getenv('FINNHUB_STREAMING') == '1':
+            self._start_quote_stream(self.finnhub_key)
+
+
         # VIP Traders Database
         self.vip_traders = {
             'Warren Buffett': {'cik': '1067983', 'strategy': 'Long-term value investing', 'company': 'Berkshire Hathaway', 'whale_link': 'https://whalewisdom.com/filer/berkshire-hathaway-inc'},
@@ -184,9 +617,20 @@ class VIPInvestBot:
             'Abu Dhabi Investment Authority': {'cik': '1040273', 'strategy': 'Sovereign wealth fund', 'company': 'Abu Dhabi Investment Authority', 'whale_link': 'https://whalewisdom.com/filer/abu-dhabi-investment-authority'}
         }
         
-        session = self.market.get_market_session()
-        session_emoji = self.market.get_session_emoji()
-        
+        # Int-keyed views of the watchlist so joining against EDGAR's
+        # CIK-keyed data is one hashed-int membership test per entry
+        self._cik_set = {int(info['cik']) for info in self.vip_traders.values()}
+        self.traders_by_cik: Dict[int, list] = {}
+        for trader_name, info in self.vip_traders.items():
+            self.traders_by_cik.setdefault(int(info['cik']), []).append((trader_name, info))
+        for cik, traders in self.traders_by_cik.items():
+            if len(traders) > 2:
+                # Almost certainly a data bug in vip_traders (placeholder CIK);
+                # we still only fetch the CIK once, but flag it for cleanup
+                print(f"⚠️ {len(traders)} traders share CIK {cik} - check their entries in vip_traders")
+
+        _, session, session_emoji = self.market.snapshot()
+
         print(f"🤖 VIP InvestBot starting - {datetime.now()}")
         print(f"{session_emoji} Market Status: {session.upper()}")
         print(f"📊 24/7 PRICE MONITORING: ACTIVE (STATEFUL - NO REPEATS)")
@@ -196,47 +640,117 @@ class VIPInvestBot:
         print(f"📈 Price movements: ENABLED (40+ major stocks)")
         print(f"📅 Earnings calendar: DISABLED (reduced notifications)")
     
-    def send_telegram_alert(self, message, urgency="HIGH"):
-        if not self.bot_token or not self.chat_id:
+    def _on_quote(self, ws, raw):
+        try:
+            msg = _loads(raw)
+            for trade in msg.get('data', []):
+                self.latest_price[trade['s']] = (trade['p'], time.time())
+        except Exception:
+            pass  # malformed frame - the next trade overwrites it anyway
+
+    def _start_quote_stream(self, api_key):
+        def _on_open(ws):
+            for ticker in MAJOR_TICKERS:
+                ws.send(json.dumps({'type': 'subscribe', 'symbol': ticker}))
+        self._ws = websocket.WebSocketApp(
+            f'wss://ws.finnhub.io?token={api_key}',
+            on_open=_on_open, on_message=self._on_quote
+        )
+        threading.Thread(target=self._ws.run_forever, daemon=True).start()
+        print(f"📡 Streaming live trades for {len(MAJOR_TICKERS)} tickers over one socket")
+
+    def healthcheck(self, timeout=2.0) -> HealthStatus:
+        """Cheap readiness probe: one AAPL quote plus one Telegram getMe.
+
+        Tight connect/read timeouts mean a dead API or revoked token shows
+        up in a couple hundred milliseconds, instead of at the end of a
+        full monitoring scan.
+        """
+        started = time.monotonic()
+        finnhub_ok = False
+        telegram_ok = False
+        try:
+            response = self.session.get(
+                'https://finnhub.io/api/v1/quote',
+                params={'symbol': 'AAPL', 'token': self.finnhub_key or ''},
+                timeout=(1, timeout)
+            )
+            finnhub_ok = response.status_code == 200 and 'c' in _loads(response.content)
+        except Exception as e:
+            print(f"⚠️ Finnhub healthcheck failed: {e}")
+        try:
+            if self.bot_token:
+                response = self.telegram_session.get(
+                    f"https://api.telegram.org/bot{self.bot_token}/getMe",
+                    timeout=(1, timeout)
+                )
+                telegram_ok = response.status_code == 200
+        except Exception as e:
+            print(f"⚠️ Telegram healthcheck failed: {e}")
+        latency_ms = (time.monotonic() - started) * 1000.0
+        return HealthStatus(finnhub_ok, telegram_ok, latency_ms)
+
+    def send_telegram_alert(self, message, urgency="HIGH", session_snapshot=None):
+        if not self.bot_token or not self.chat_ids:
             print("❌ Missing Telegram credentials")
             return False
         try:
             url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
             urgency_icons = {"CRITICAL": "🚨🚨🚨", "HIGH": "🚨", "MEDIUM": "⚠️", "LOW": "📊"}
-            session_emoji = self.market.get_session_emoji()
-            session = self.market.get_market_session()
+            if session_snapshot is None:
+                session_snapshot = self.market.snapshot()
+            _, session, session_emoji = session_snapshot
             icon = urgency_icons.get(urgency, "📊")
             formatted_message = f"{icon} *VIP InvestBot Alert* {session_emoji}\n"
             formatted_message += f"_{session.replace('_', ' ').title()} Session_\n\n{message}"
-            data = {'chat_id': self.chat_id, 'text': formatted_message, 'parse_mode': 'Markdown', 'disable_web_page_preview': False}
-            response = requests.post(url, data=data, timeout=10)
-            if response.status_code == 200:
-                print(f"✅ {urgency} alert sent to Telegram successfully!")
-                return True
-            else:
-                print(f"❌ Telegram API error: {response.status_code}")
-                print(f"❌ Response: {response.text}")
+
+            def _send_one(chat_id):
+                data = {'chat_id': chat_id, 'text': formatted_message, 'parse_mode': 'Markdown', 'disable_web_page_preview': False}
+                for attempt in (1, 2):
+                    _TELEGRAM_RATE_LIMITER.acquire()
+                    response = self.telegram_session.post(url, data=data, timeout=10)
+                    if response.status_code == 200:
+                        return True
+                    if response.status_code == 429 and attempt == 1:
+                        # Back off this destination only - the others keep going
+                        retry_after = 1
+                        try:
+                            retry_after = int(_loads(response.content)['parameters']['retry_after'])
+                        except Exception:
+                            pass
+                        time.sleep(min(retry_after, 60))
+                        continue
+                    print(f"❌ Telegram API error for chat {chat_id}: {response.status_code}")
+                    print(f"❌ Response: {response.text}")
+                    return False
                 return False
+
+            # Telegram's limits are mostly per-chat, so multi-destination
+            # sends overlap instead of paying N round trips serially
+            if len(self.chat_ids) == 1:
+                results = [_send_one(self.chat_ids[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(5, len(self.chat_ids))) as executor:
+                    results = list(executor.map(_send_one, self.chat_ids))
+            if all(results):
+                print(f"✅ {urgency} alert sent to {len(self.chat_ids)} Telegram chat(s)!")
+                return True
+            return False
         except Exception as e:
             print(f"❌ Failed to send alert: {e}")
             return False
 
     def get_company_name(self, ticker):
-        company_names = {
-            'AAPL': 'Apple Inc.', 'MSFT': 'Microsoft Corporation', 'GOOGL': 'Alphabet Inc.', 'GOOG': 'Alphabet Inc.', 'AMZN': 'Amazon.com Inc.', 'TSLA': 'Tesla Inc.', 'NVDA': 'NVIDIA Corporation', 'META': 'Meta Platforms Inc.', 'BRK-B': 'Berkshire Hathaway', 'JPM': 'JPMorgan Chase & Co.', 'JNJ': 'Johnson & Johnson', 'PG': 'Procter & Gamble', 'HD': 'The Home Depot', 'BAC': 'Bank of America', 'UNH': 'UnitedHealth Group', 'V': 'Visa Inc.', 'MA': 'Mastercard Inc.', 'WMT': 'Walmart Inc.', 'DIS': 'The Walt Disney Company', 'NFLX': 'Netflix Inc.', 'CRM': 'Salesforce Inc.', 'ADBE': 'Adobe Inc.', 'ORCL': 'Oracle Corporation', 'CSCO': 'Cisco Systems', 'INTC': 'Intel Corporation', 'AMD': 'Advanced Micro Devices', 'QCOM': 'QUALCOMM Inc.', 'TXN': 'Texas Instruments', 'AVGO': 'Broadcom Inc.', 'HON': 'Honeywell International', 'CAT': 'Caterpillar Inc.', 'BA': 'The Boeing Company', 'GE': 'General Electric', 'MMM': '3M Company', 'KO': 'The Coca-Cola Company', 'PEP': 'PepsiCo Inc.', 'MCD': 'McDonald\'s Corporation', 'NKE': 'NIKE Inc.', 'SBUX': 'Starbucks Corporation'
-        }
-        return company_names.get(ticker, f"{ticker} Inc.")
+        return COMPANY_NAMES.get(ticker, f"{ticker} Inc.")
     
     def get_stock_price(self, ticker):
         """Get current stock price using Finnhub API"""
         try:
-            FINNHUB_API_KEY = os.getenv('FINNHUB_API_KEY')
-            if not FINNHUB_API_KEY:
+            if self.finnhub_client is None:
                 return None
-                
-            finnhub_client = finnhub.Client(api_key=FINNHUB_API_KEY)
-            quote = finnhub_client.quote(ticker)
-            
+
+            quote = self.finnhub_client.quote(ticker)
+
             if quote and 'c' in quote:
                 return quote['c']
             return None
@@ -246,123 +760,316 @@ class VIPInvestBot:
     
     def get_ticker_from_company_name(self, company_name):
         """Convert company name to ticker symbol"""
-        ticker_mapping = {
-            'Apple Inc.': 'AAPL', 'Microsoft Corporation': 'MSFT', 'Alphabet Inc.': 'GOOGL',
-            'Amazon.com Inc.': 'AMZN', 'Tesla Inc.': 'TSLA', 'NVIDIA Corporation': 'NVDA',
-            'Meta Platforms Inc.': 'META', 'Berkshire Hathaway': 'BRK-B', 'JPMorgan Chase & Co.': 'JPM',
-            'Johnson & Johnson': 'JNJ', 'Procter & Gamble': 'PG', 'The Home Depot': 'HD',
-            'Bank of America': 'BAC', 'UnitedHealth Group': 'UNH', 'Visa Inc.': 'V',
-            'Mastercard Inc.': 'MA', 'Walmart Inc.': 'WMT', 'The Walt Disney Company': 'DIS',
-            'Netflix Inc.': 'NFLX', 'Salesforce Inc.': 'CRM', 'Adobe Inc.': 'ADBE',
-            'Oracle Corporation': 'ORCL', 'Cisco Systems': 'CSCO', 'Intel Corporation': 'INTC',
-            'Advanced Micro Devices': 'AMD', 'QUALCOMM Inc.': 'QCOM', 'Texas Instruments': 'TXN',
-            'Broadcom Inc.': 'AVGO', 'Honeywell International': 'HON', 'Caterpillar Inc.': 'CAT',
-            'The Boeing Company': 'BA', 'General Electric': 'GE', '3M Company': 'MMM',
-            'The Coca-Cola Company': 'KO', 'PepsiCo Inc.': 'PEP', 'McDonald\'s Corporation': 'MCD',
-            'NIKE Inc.': 'NKE', 'Starbucks Corporation': 'SBUX', 'Chevron Corp': 'CVX',
-            'Occidental Petroleum': 'OXY', 'Activision Blizzard': 'ATVI', 'Wells Fargo & Co': 'WFC',
-            'Verizon Communications': 'VZ', 'Exxon Mobil': 'XOM', 'ConocoPhillips': 'COP'
-        }
-        return ticker_mapping.get(company_name, None)
+        return TICKER_OF.get(company_name, None)
     
+    # Ticker classes and session multipliers for alert thresholds,
+    # built once at class creation - get_alert_threshold is called per
+    # ticker per scan
+    LARGE_CAP_STABLE = frozenset({'AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'BRK-B', 'JPM', 'V', 'MA', 'UNH', 'JNJ', 'PG', 'HD', 'PFE', 'KO', 'PEP', 'WMT', 'MCD'})
+    HIGH_VOLATILITY = frozenset({'TSLA', 'NVDA', 'AMD', 'ROKU', 'ZM', 'PTON', 'SNAP', 'UBER', 'COIN', 'HOOD', 'RIVN', 'LCID', 'NIO', 'XPEV', 'PLTR'})
+    SESSION_MULT = {'closed': 2.0, 'pre_market': 1.3, 'after_hours': 1.1, 'regular': 1.0}
+
+    def _compute_threshold(self, ticker, session):
+        base_threshold = 3.5 if ticker in self.LARGE_CAP_STABLE else 6.0 if ticker in self.HIGH_VOLATILITY else 4.5
+        return base_threshold * self.SESSION_MULT.get(session, 1.0)
+
     def get_alert_threshold(self, ticker):
-        large_cap_stable = ['AAPL', 'MSFT', 'GOOGL', 'GOOG', 'AMZN', 'BRK-B', 'JPM', 'V', 'MA', 'UNH', 'JNJ', 'PG', 'HD', 'PFE', 'KO', 'PEP', 'WMT', 'MCD']
-        high_volatility = ['TSLA', 'NVDA', 'AMD', 'ROKU', 'ZM', 'PTON', 'SNAP', 'UBER', 'COIN', 'HOOD', 'RIVN', 'LCID', 'NIO', 'XPEV', 'PLTR']
-        base_threshold = 3.5 if ticker in large_cap_stable else 6.0 if ticker in high_volatility else 4.5
-        session = self.market.get_market_session()
-        if session == 'closed': return base_threshold * 2.0
-        elif session == 'pre_market': return base_threshold * 1.3
-        elif session == 'after_hours': return base_threshold * 1.1
-        else: return base_threshold
+        return self._compute_threshold(ticker, self.market.get_market_session())
     
+    def quick_probe(self):
+        """Cheap probe deciding whether the full scans are worth running.
+
+        Returns (filings_changed, market_moving): one HEAD request against the
+        EDGAR index compared to the cached Last-Modified baseline, and one SPY
+        quote as a market-wide movement proxy. Errs on (True, True) so a probe
+        failure never suppresses a real scan.
+        """
+        filings_changed = True
+        market_moving = True
+        try:
+            now = datetime.now()
+            qtr = (now.month - 1) // 3 + 1
+            index_url = f"https://www.sec.gov/Archives/edgar/full-index/{now.year}/QTR{qtr}/form.idx"
+            response = self.session.head(index_url, headers=self.index_headers, timeout=10)
+            last_modified = response.headers.get('Last-Modified')
+            if last_modified:
+                baseline = _probe_cache.get('edgar-index-last-modified', ttl=90 * 24 * 3600)
+                filings_changed = last_modified != baseline
+                # Don't advance the baseline yet: if the gated scan fails,
+                # the next probe must still see these filings as new
+                self._pending_index_baseline = last_modified
+        except Exception as e:
+            print(f"⚠️ EDGAR probe failed ({e}) - running full filing scan")
+        try:
+            if self.finnhub_client is not None:
+                quote = self.finnhub_client.quote('SPY')
+                if quote and quote.get('c') and quote.get('pc'):
+                    spy_change = abs((quote['c'] - quote['pc']) / quote['pc']) * 100
+                    market_moving = spy_change >= 0.5
+        except Exception as e:
+            print(f"⚠️ SPY probe failed ({e}) - running full price scan")
+        return filings_changed, market_moving
+
+    def commit_probe_baseline(self):
+        """Advance the EDGAR probe baseline after a successful scan.
+
+        Called by the scan driver once the filing check completed, so a
+        failed run leaves the old baseline in place and the next probe
+        still reports the index as changed.
+        """
+        if self._pending_index_baseline is not None:
+            _probe_cache.set('edgar-index-last-modified', self._pending_index_baseline)
+            self._pending_index_baseline = None
+
+    # TTL deliberately shorter than the 15-minute scan cadence: it only
+    # collapses repeated calls within one run (dry run + monitoring), while
+    # every scheduled scan still makes the conditional GET below and lets
+    # the ETag/If-Modified-Since cursor decide whether anything is new
+    @cached(ttl=10 * 60)
+    def _fetch_form_index(self):
+        """Fetch EDGAR's quarterly form index once per run (one HTTP call for all traders).
+
+        Returns a list of (form, cik, filing_date, accession_number) tuples, or None
+        if the index could not be fetched (callers fall back to per-CIK lookups).
+        """
+        now = datetime.now()
+        cutoff = now - timedelta(days=5)
+        quarters = {(now.year, (now.month - 1) // 3 + 1), (cutoff.year, (cutoff.month - 1) // 3 + 1)}
+        entries = []
+        store = _get_store()
+        try:
+            for year, qtr in sorted(quarters):
+                index_url = f"https://www.sec.gov/Archives/edgar/full-index/{year}/QTR{qtr}/form.idx"
+                # Send the persisted ETag/Last-Modified cursor; a 304 means
+                # nothing was filed since the last parse, so skip entirely
+                headers = dict(self.index_headers)
+                etag = store.get_meta(f'edgar-etag:{index_url}')
+                last_modified = store.get_meta(f'edgar-last-modified:{index_url}')
+                if etag:
+                    headers['If-None-Match'] = etag
+                if last_modified:
+                    headers['If-Modified-Since'] = last_modified
+                response = self.session.get(index_url, headers=headers, timeout=30)
+                if response.status_code == 304:
+                    print(f"✅ EDGAR index unchanged (304) for {year} QTR{qtr} - nothing to parse")
+                    continue
+                if response.status_code != 200:
+                    print(f"❌ EDGAR index fetch failed: {response.status_code}")
+                    return None
+                if response.headers.get('ETag'):
+                    store.set_meta(f'edgar-etag:{index_url}', response.headers['ETag'])
+                if response.headers.get('Last-Modified'):
+                    store.set_meta(f'edgar-last-modified:{index_url}', response.headers['Last-Modified'])
+                # form.idx is fixed-width: Form Type | Company Name | CIK | Date Filed | File Name
+                for line in response.text.splitlines():
+                    if len(line) < 98:
+                        continue
+                    filing_date = line[86:98].strip()
+                    if not filing_date[:4].isdigit():
+                        continue  # header/separator lines
+                    form = line[0:12].strip()
+                    cik = line[74:86].strip()
+                    file_name = line[98:].strip()
+                    accession = file_name.rsplit('/', 1)[-1].replace('.txt', '')
+                    entries.append((form, cik, filing_date, accession))
+            return entries
+        except Exception as e:
+            print(f"❌ Error fetching EDGAR form index: {e}")
+            return None
+
     def check_vip_filings(self):
+        """Yield new VIP filing dicts as they are found (lazy; callers list() if needed)."""
         print("🔍 Checking VIP trader SEC filings...")
-        new_filings = []
-        for trader_name, info in self.vip_traders.items():
+        index_entries = self._fetch_form_index()
+        if index_entries is None:
+            # Index unavailable - fall back to the old per-CIK submission lookups
+            yield from self._check_vip_filings_per_cik()
+            return
+
+        cutoff_date = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
+
+        for form, cik, filing_date, accession in index_entries:
+            if form not in TRACKED_FORMS or filing_date < cutoff_date:
+                continue
+            cik_int = int(cik)
+            if cik_int not in self._cik_set:
+                continue
+            for trader_name, info in self.traders_by_cik[cik_int]:
+                alert_key = f"file-{info['cik']}-{accession}"
+                if not has_alert_been_sent(alert_key):
+                    print(f"🆕 NEW FILING: {trader_name} filed {form} on {filing_date}. Queued.")
+                    yield Filing(
+                        trader=trader_name,
+                        company=info['company'],
+                        form=form,
+                        date=filing_date,
+                        strategy=info['strategy'],
+                        whale_link=info['whale_link'],
+                        accession_number=accession,
+                        cik=info['cik'],
+                        alert_key=alert_key
+                    )
+
+    def _fetch_one_cik(self, traders):
+        """Fetch one CIK's submissions and fan matching filings out to every trader sharing it."""
+        filings = []
+        cik = traders[0][1]['cik']
+        try:
+            _SEC_RATE_LIMITER.acquire()
+            filings_url = f"https://data.sec.gov/submissions/CIK{cik.zfill(10)}.json"
+            response = self.session.get(filings_url, headers=self.headers, timeout=15)
+            if response.status_code == 200:
+                data = _loads(response.content)
+                recent_filings = data.get('filings', {}).get('recent', {})
+                forms = recent_filings.get('form', [])
+                dates = recent_filings.get('filingDate', [])
+                accs = recent_filings.get('accessionNumber', [])
+                cutoff_date = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
+                for i, form in enumerate(forms):
+                    filing_date = dates[i]
+                    # EDGAR returns filings newest-first, so once we fall
+                    # below the cutoff everything after it is older too
+                    if filing_date < cutoff_date:
+                        break
+                    if form not in TRACKED_FORMS:
+                        continue
+                    alert_key = f"file-{cik}-{accs[i]}"
+                    if not has_alert_been_sent(alert_key):
+                        for trader_name, info in traders:
+                            print(f"🆕 NEW FILING: {trader_name} filed {form} on {filing_date}. Queued.")
+                            filings.append(Filing(
+                                trader=trader_name,
+                                company=info['company'],
+                                form=form,
+                                date=filing_date,
+                                strategy=info['strategy'],
+                                whale_link=info['whale_link'],
+                                accession_number=accs[i],
+                                cik=cik,
+                                alert_key=alert_key
+                            ))
+        except Exception as e:
+            print(f"❌ Error checking CIK {cik}: {e}")
+        return filings
+
+    def _check_vip_filings_per_cik(self):
+        """Fallback path: one submissions lookup per unique CIK (many traders
+        share one), fanned out over a thread pool with a shared token bucket
+        keeping us under the SEC's 10 req/s fair-access limit."""
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = executor.map(self._fetch_one_cik, self.traders_by_cik.values())
+            for filings in results:
+                yield from filings
+
+    # TTL well below any scan cadence (shortest is SCAN_INTERVAL=300 loop
+    # mode): the cache only collapses repeated calls within one run, so a
+    # scheduled scan never alerts on a stale price as if it were current
+    @cached(ttl=60)
+    def fetch_quotes_batch(self, tickers):
+        """Fetch quotes for all tickers in one shot, returning {ticker: quote}.
+
+        Finnhub's free tier has no multi-symbol quote endpoint, so "batch" here
+        means fanning the single-symbol calls out over a thread pool - one wall
+        clock round-trip instead of N.
+        """
+        if not self.finnhub_key:
+            print("❌❌ ERROR: FINNHUB_API_KEY not found.")
+            return {}
+
+        # One comma-joined request covers the whole watchlist in a single
+        # round trip when the plan supports it; a rejection is remembered
+        # so later scans skip straight to the fan-out
+        if not self._multi_quote_unsupported:
             try:
-                filings_url = f"https://data.sec.gov/submissions/CIK{info['cik'].zfill(10)}.json"
-                response = requests.get(filings_url, headers=self.headers, timeout=15)
+                _FINNHUB_RATE_LIMITER.acquire()
+                response = self.session.get(
+                    'https://finnhub.io/api/v1/quote',
+                    params={'symbol': ','.join(tickers), 'token': self.finnhub_key},
+                    timeout=10
+                )
                 if response.status_code == 200:
-                    data = response.json()
-                    recent_filings = data.get('filings', {}).get('recent', {})
-                    cutoff_date = (datetime.now() - timedelta(days=5)).strftime('%Y-%m-%d')
-                    for i, form in enumerate(recent_filings.get('form', [])):
-                        filing_date = recent_filings.get('filingDate', [])[i]
-                        if form in ['13F-HR', '13F-NT', '4', 'SC 13G', 'SC 13D', '8-K'] and filing_date >= cutoff_date:
-                            alert_key = f"file-{info['cik']}-{recent_filings.get('accessionNumber', [])[i]}"
-                            if not has_alert_been_sent(alert_key):
-                                filing_info = {
-                                    'trader': trader_name, 
-                                    'company': info['company'], 
-                                    'form': form, 
-                                    'date': filing_date, 
-                                    'strategy': info['strategy'], 
-                                    'whale_link': info['whale_link'], 
-                                    'accession_number': recent_filings.get('accessionNumber', [])[i], 
-                                    'cik': info['cik'], 
-                                    'alert_key': alert_key
-                                }
-                                new_filings.append(filing_info)
-                                print(f"🆕 NEW FILING: {trader_name} filed {form} on {filing_date}. Queued.")
-                time.sleep(0.4)
+                    data = _loads(response.content)
+                    # Expect one quote dict per requested symbol, in order
+                    if (isinstance(data, list) and len(data) == len(tickers)
+                            and all(isinstance(q, dict) and 'c' in q for q in data)):
+                        return dict(zip(tickers, data))
+                print("ℹ️ Multi-symbol quotes unsupported - falling back to per-symbol fetches")
+                self._multi_quote_unsupported = True
             except Exception as e:
-                print(f"❌ Error checking {trader_name}: {e}")
-        return new_filings
+                print(f"ℹ️ Multi-symbol quote attempt failed ({e}) - falling back to per-symbol fetches")
+                self._multi_quote_unsupported = True
+
+        # Hit the REST endpoint directly through the pooled session rather
+        # than the finnhub-python wrapper, which hides its own per-client
+        # session; the token bucket keeps us under the free-tier 30 req/s
+        def _fetch_quote(ticker):
+            try:
+                _FINNHUB_RATE_LIMITER.acquire()
+                response = self.session.get(
+                    'https://finnhub.io/api/v1/quote',
+                    params={'symbol': ticker, 'token': self.finnhub_key},
+                    timeout=5
+                )
+                response.raise_for_status()
+                return ticker, _loads(response.content)
+            except Exception as e:
+                print(f"❌ Error checking {ticker}: {e}")
+                return ticker, None
+
+        with ThreadPoolExecutor(max_workers=30) as executor:
+            return dict(executor.map(_fetch_quote, tickers))
 
     def check_major_price_moves(self):
-        """Check for significant price movements using Finnhub API"""
+        """Yield significant price moves using Finnhub API (lazy; callers list() if needed)."""
         print("📈 Checking price movements 24/7...")
-        FINNHUB_API_KEY = os.getenv('FINNHUB_API_KEY')
-        if not FINNHUB_API_KEY:
-            print("❌❌ ERROR: FINNHUB_API_KEY not found.")
-            return []
 
-        major_tickers = ['AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'META', 'TSLA', 'BRK-B', 'JPM', 'V', 'MA', 'UNH', 'JNJ', 'PG', 'HD', 'BAC', 'WMT', 'DIS', 'NFLX', 'CRM', 'ADBE', 'ORCL', 'CSCO', 'INTC', 'AMD', 'QCOM', 'TXN', 'AVGO', 'HON', 'CAT', 'BA', 'GE', 'MMM', 'KO', 'PEP', 'MCD', 'NKE', 'SBUX']
-        
-        new_price_moves = []
-        
         try:
-            finnhub_client = finnhub.Client(api_key=FINNHUB_API_KEY)
-            
-            for ticker in major_tickers:
-                try:
-                    quote = finnhub_client.quote(ticker)
-                    if quote and 'c' in quote and 'pc' in quote:
-                        current_price = quote['c']
-                        previous_close = quote['pc']
-                        
-                        if current_price and previous_close and previous_close > 0:
-                            price_change_pct = ((current_price - previous_close) / previous_close) * 100
-                            threshold = self.get_alert_threshold(ticker)
-                            
-                            if abs(price_change_pct) >= threshold:
-                                alert_key = f"price-{ticker}-{datetime.now().strftime('%Y-%m-%d-%H')}"
-                                
-                                if not has_alert_been_sent(alert_key):
-                                    move_info = {
-                                        'ticker': ticker,
-                                        'company_name': self.get_company_name(ticker),
-                                        'current_price': current_price,
-                                        'previous_close': previous_close,
-                                        'change_pct': price_change_pct,
-                                        'change_amount': current_price - previous_close,
-                                        'alert_key': alert_key,
-                                        'threshold': threshold
-                                    }
-                                    new_price_moves.append(move_info)
-                                    print(f"🆕 NEW PRICE MOVE: {ticker} {price_change_pct:+.2f}% (threshold: {threshold}%). Queued.")
-                    
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    print(f"❌ Error checking {ticker}: {e}")
-                    continue
-                    
+            quotes = self.fetch_quotes_batch(MAJOR_TICKERS)
+
+            # Overlay fresher streamed prices on the REST quotes (which can
+            # be a whole cache TTL old); prev-close still comes from REST
+            for ticker, (price, ts) in list(self.latest_price.items()):
+                if ticker in quotes and quotes[ticker] and time.time() - ts < 300:
+                    quotes[ticker] = {**quotes[ticker], 'c': price}
+
+            # Vectorize the change/threshold math over the whole batch;
+            # only surviving indices are turned back into Python objects
+            tickers = [t for t, q in quotes.items()
+                       if q and q.get('c') and q.get('pc') and q['pc'] > 0]
+            if not tickers:
+                return
+            prices = np.fromiter((quotes[t]['c'] for t in tickers), dtype=np.float64)
+            prev = np.fromiter((quotes[t]['pc'] for t in tickers), dtype=np.float64)
+            # The session can't change mid-scan, so resolve it once instead
+            # of re-running the holiday/weekend checks per ticker
+            session = self.market.get_market_session()
+            thresholds = np.fromiter((self._compute_threshold(t, session) for t in tickers), dtype=np.float64)
+            change_pcts = (prices - prev) / prev * 100.0
+
+            for i in np.nonzero(np.abs(change_pcts) >= thresholds)[0]:
+                ticker = tickers[i]
+                current_price = quotes[ticker]['c']
+                previous_close = quotes[ticker]['pc']
+                price_change_pct = float(change_pcts[i])
+                threshold = float(thresholds[i])
+                alert_key = f"price-{ticker}-{datetime.now().strftime('%Y-%m-%d-%H')}"
+
+                if not has_alert_been_sent(alert_key):
+                    print(f"🆕 NEW PRICE MOVE: {ticker} {price_change_pct:+.2f}% (threshold: {threshold}%). Queued.")
+                    yield Move(
+                        ticker=ticker,
+                        company_name=self.get_company_name(ticker),
+                        current_price=current_price,
+                        previous_close=previous_close,
+                        change_pct=price_change_pct,
+                        change_amount=current_price - previous_close,
+                        alert_key=alert_key,
+                        threshold=threshold,
+                        abs_pct=abs(price_change_pct)
+                    )
+
         except Exception as e:
             print(f"❌❌ ERROR in check_major_price_moves: {e}")
-            return []
-            
-        return new_price_moves
     
     def format_vip_filing_alert(self, filings):
         """Format VIP filing alerts in news-style"""
@@ -370,16 +1077,15 @@ class VIPInvestBot:
             header = f"📰 *BREAKING: {len(filings)} VIP TRADERS MAKE MAJOR MOVES*"
         else:
             filing = filings[0]
-            header = f"📰 *BREAKING: {filing['trader']}'s Q4 Moves Revealed*"
-        
-        message = f"{header}\n\n"
+            header = f"📰 *BREAKING: {filing.trader}'s Q4 Moves Revealed*"
         
+        # Grow a list and join once - repeated += on a str recopies the
+        # whole message per filing
+        parts = [header, "\n\n"]
         for filing in filings:
-            message += f"👤 *{filing['trader']}*\n🏢 {filing['company']}\n📄 {filing['form']} filed on {filing['date']}\n🎯 Strategy: _{filing['strategy']}_\n\n"
-            message += f"🔗 *Analysis:*\n🐋 [WhaleWisdom]({filing['whale_link']})\n📊 [QuiverQuant](https://www.quiverquant.com/sources/institutions)\n\n"
-            message += "─────────────────\n\n"
-        
-        return message
+            parts.append(_FILING_TMPL.format_map(filing._asdict()))
+
+        return "".join(parts)
 
     def format_price_movement_alert(self, moves):
         """Format price movement alerts"""
@@ -387,20 +1093,17 @@ class VIPInvestBot:
             return None
             
         header = f"📈 *{len(moves)} MAJOR PRICE MOVEMENTS DETECTED!*" if len(moves) > 1 else f"📈 *MAJOR PRICE MOVEMENT DETECTED!*"
-        message = f"{header}\n\n"
-        
-        moves.sort(key=lambda x: abs(x['change_pct']), reverse=True)
-        
+        parts = [header, "\n\n"]
+
+        moves.sort(key=lambda x: x.abs_pct, reverse=True)
+
         for move in moves:
-            direction = "🚀" if move['change_pct'] > 0 else "📉"
-            urgency = "🚨🚨🚨" if abs(move['change_pct']) >= 10 else "🚨" if abs(move['change_pct']) >= 5 else "⚠️"
-            
-            message += f"{urgency} {direction} *{move['ticker']}* - {move['company_name']}\n"
-            message += f"💰 Price: ${move['current_price']:.2f} (was ${move['previous_close']:.2f})\n"
-            message += f"📊 Change: {move['change_pct']:+.2f}% (${move['change_amount']:+.2f})\n"
-            message += f"🎯 Threshold: {move['threshold']:.1f}%\n\n"
-        
-        return message
+            direction = "🚀" if move.change_pct > 0 else "📉"
+            urgency = URGENCY_ICONS[bisect_right(URGENCY_THRESHOLDS, move.abs_pct)]
+
+            parts.append(_MOVE_TMPL.format_map({**move._asdict(), 'direction': direction, 'urgency': urgency}))
+
+        return "".join(parts)
 
     def send_daily_summary(self):
         if has_alert_been_sent(self.daily_summary_sent_key):
@@ -417,30 +1120,43 @@ class VIPInvestBot:
         return success
     
     def run_vip_monitoring(self):
-        session = self.market.get_market_session()
+        # One session snapshot per tick, shared by every alert sent below
+        snapshot = self.market.snapshot()
+        _, session, _ = snapshot
         print(f"🎯 Running STATEFUL monitoring scan - {datetime.now()}")
         print(f"({session.upper()})")
         alerts_sent_this_run = 0
         
         # Check 1: VIP Trader Filings
-        new_filings = self.check_vip_filings()
-        if new_filings:
-            alert_message = self.format_vip_filing_alert(new_filings)
-            if self.send_telegram_alert(alert_message, "CRITICAL"):
-                for filing in new_filings: mark_alert_as_sent(filing['alert_key'])
-                alerts_sent_this_run += 1
-        
+        new_filings = list(self.check_vip_filings())
         # Check 2: Price Movements
-        big_moves = self.check_major_price_moves()
-        if big_moves:
-            alert_message = self.format_price_movement_alert(big_moves)
-            if alert_message:
-                max_move = max([abs(move['change_pct']) for move in big_moves])
-                urgency = "CRITICAL" if max_move >= 10 else "HIGH" if max_move >= 5 else "MEDIUM"
-                if self.send_telegram_alert(alert_message, urgency):
-                    for move in big_moves: mark_alert_as_sent(move['alert_key'])
+        big_moves = list(self.check_major_price_moves())
+
+        # Fire the filing and price-move alerts concurrently - both go to
+        # the same keep-alive Telegram session, so the second send doesn't
+        # wait out the first one's round trip
+        sends = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            if new_filings:
+                alert_message = self.format_vip_filing_alert(new_filings)
+                sends.append((
+                    executor.submit(self.send_telegram_alert, alert_message, "CRITICAL", snapshot),
+                    [filing.alert_key for filing in new_filings]
+                ))
+            if big_moves:
+                alert_message = self.format_price_movement_alert(big_moves)
+                if alert_message:
+                    max_move = max(move.abs_pct for move in big_moves)
+                    urgency = URGENCY_LABELS[bisect_right(URGENCY_THRESHOLDS, max_move)]
+                    sends.append((
+                        executor.submit(self.send_telegram_alert, alert_message, urgency, snapshot),
+                        [move.alert_key for move in big_moves]
+                    ))
+            for future, alert_keys in sends:
+                if future.result():
+                    for alert_key in alert_keys: mark_alert_as_sent(alert_key)
                     alerts_sent_this_run += 1
-        
+
         # Check 3: Send daily summary if no alerts were sent
         if alerts_sent_this_run == 0:
             self.send_daily_summary()
@@ -452,10 +1168,30 @@ if __name__ == "__main__":
     print("🚀 Starting VIP InvestBot - STATEFUL VERSION...")
     load_sent_alerts()
     bot = VIPInvestBot()
-    alerts_sent = bot.run_vip_monitoring()
-    save_sent_alerts()
-    if alerts_sent > 0:
-        print(f"🚨 SUCCESS: Sent {alerts_sent} new, unique alerts!")
+
+    # Default is one scan and exit (GitHub Actions / cron drive the
+    # schedule). Set SCAN_INTERVAL (seconds) to loop in-process instead:
+    # a plain monotonic-clock loop, so wall-clock jumps can't cause
+    # drift or double runs
+    interval = int(os.getenv('SCAN_INTERVAL', '0'))
+    if interval > 0:
+        print(f"🔁 Loop mode: scanning every {interval}s (SCAN_INTERVAL)")
+        while True:
+            next_t = time.monotonic() + interval
+            try:
+                alerts_sent = bot.run_vip_monitoring()
+                # Persist between scans, not just at shutdown
+                save_sent_alerts()
+                if alerts_sent > 0:
+                    print(f"🚨 Sent {alerts_sent} new, unique alerts this scan!")
+            except Exception as e:
+                print(f"❌ Scan failed: {e}")
+            time.sleep(max(0, next_t - time.monotonic()))
     else:
-        print("✅ SUCCESS: Monitoring complete, no new alerts to send.")
-    print("🎯 VIP InvestBot execution complete!")
+        alerts_sent = bot.run_vip_monitoring()
+        save_sent_alerts()
+        if alerts_sent > 0:
+            print(f"🚨 SUCCESS: Sent {alerts_sent} new, unique alerts!")
+        else:
+            print("✅ SUCCESS: Monitoring complete, no new alerts to send.")
+        print("🎯 VIP InvestBot execution complete!")
@@ -0,0 +1,68 @@
+# Simple TTL'd on-disk cache for VIP InvestBot network fetches
+# Lets repeated dry runs skip SEC/Finnhub round-trips entirely
+
+import functools
+import hashlib
+import json
+import os
+import time
+
+CACHE_DIR = ".cache"
+
+
+class FileCache:
+    """JSON file cache keyed by MD5, expired via file mtime."""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, key):
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+
+    def get(self, key, ttl):
+        """Return the cached value for key, or None if missing/older than ttl seconds."""
+        path = self._path(key)
+        try:
+            if not os.path.exists(path):
+                return None
+            if time.time() - os.path.getmtime(path) > ttl:
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Cache read failed for {key}: {e}")
+            return None
+
+    def set(self, key, value):
+        """Store a JSON-serializable value under key."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._path(key), 'w') as f:
+                json.dump(value, f)
+        except Exception as e:
+            print(f"⚠️ Cache write failed for {key}: {e}")
+
+
+_cache = FileCache()
+
+
+def cached(ttl):
+    """Cache a VIPInvestBot method's result on disk for ttl seconds.
+
+    The cache key is built from the method name and its arguments (self is
+    skipped). Falsy results (failed fetches) are never cached.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            key = f"{func.__qualname__}:{args!r}:{kwargs!r}"
+            value = _cache.get(key, ttl)
+            if value is not None:
+                return value
+            value = func(self, *args, **kwargs)
+            if value:
+                _cache.set(key, value)
+            return value
+        return wrapper
+    return decorator
@@ -0,0 +1,82 @@
+# Near-duplicate alert suppression for VIP InvestBot
+# Exact-key dedup still lets near-duplicates through (same trader/form with a
+# new accession number, same ticker moving again minutes later); MinHash+LSH
+# catches those by text similarity instead of exact match.
+
+import os
+import pickle
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
+
+INDEX_FILE = "sent_alerts.lsh"
+
+
+class MinHashDedup:
+    """MinHash/LSH index over normalized alert text (J=0.95, 128 permutations).
+
+    Falls back to exact-match on the normalized text if datasketch is not
+    installed, which is strictly no worse than the old behavior.
+    """
+
+    def __init__(self, threshold=0.95, num_perm=128, index_file=INDEX_FILE):
+        self.num_perm = num_perm
+        self.index_file = index_file
+        self.seen_exact = set()
+        self.lsh = None
+        try:
+            if os.path.exists(index_file):
+                with open(index_file, 'rb') as f:
+                    self.lsh, self.seen_exact = pickle.load(f)
+            elif DATASKETCH_AVAILABLE:
+                self.lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        except Exception as e:
+            print(f"⚠️ Could not load dedup index: {e}")
+            if DATASKETCH_AVAILABLE:
+                self.lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        if not DATASKETCH_AVAILABLE:
+            print("⚠️ datasketch not installed - falling back to exact-text dedup")
+
+    def _minhash(self, text):
+        m = MinHash(num_perm=self.num_perm)
+        for token in text.lower().split():
+            m.update(token.encode('utf8'))
+        return m
+
+    def is_duplicate(self, text):
+        """Check whether a near-identical alert text was already indexed."""
+        if self.lsh is not None:
+            return bool(self.lsh.query(self._minhash(text)))
+        return text in self.seen_exact
+
+    def add(self, key, text):
+        """Index an alert text under a unique key."""
+        if self.lsh is not None:
+            try:
+                self.lsh.insert(key, self._minhash(text))
+            except ValueError:
+                pass  # key already indexed
+        self.seen_exact.add(text)
+
+    def filter_new(self, items, text_of):
+        """Drop items whose normalized text near-matches an indexed alert."""
+        kept = []
+        for item in items:
+            text = text_of(item)
+            if self.is_duplicate(text):
+                print(f"🔁 Skipping near-duplicate alert: {text}")
+                continue
+            self.add(item.alert_key, text)
+            kept.append(item)
+        return kept
+
+    def save(self):
+        """Persist the index alongside the sent-alerts log."""
+        try:
+            with open(self.index_file, 'wb') as f:
+                pickle.dump((self.lsh, self.seen_exact), f)
+        except Exception as e:
+            print(f"❌ Failed to save dedup index: {e}")
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Regression tests for the hashed alert-key store."""
+
+from investbot import AlertStore, _key_hash
+
+# Digest of this key is above 2**63 unsigned - the exact shape that
+# raised OverflowError on SQLite's signed 64-bit INTEGER binds
+BIG_DIGEST_KEY = "price-TSLA-2025-01-02-01"
+
+
+def test_key_hash_fits_signed_sqlite_range():
+    digest = _key_hash(BIG_DIGEST_KEY)
+    assert digest < 0  # unsigned value is 12257967076561439380
+    assert -(2 ** 63) <= digest < 2 ** 63
+
+
+def test_store_roundtrips_key_with_high_digest(tmp_path, monkeypatch):
+    # AlertStore writes its db, bloom sidecar and legacy-log migration
+    # relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    store = AlertStore()
+    assert not store.seen(BIG_DIGEST_KEY)
+    store.mark(BIG_DIGEST_KEY)
+    assert store.seen(BIG_DIGEST_KEY)
+    assert store.flush() == 1  # previously raised OverflowError here
+    assert store.seen(BIG_DIGEST_KEY)
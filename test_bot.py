@@ -5,21 +5,71 @@ Run this to test your bot locally and see what messages you'd receive
 """
 
 import os
+import re
 import sys
 from investbot import VIPInvestBot, load_sent_alerts, save_sent_alerts
 
+REQUIRED_VARS = ('TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHAT_ID', 'FINNHUB_API_KEY')
+
+# Shape checks so bad config fails here in microseconds instead of deep
+# inside the first HTTP call: int means "one integer, or a comma-separated
+# list of them" (TELEGRAM_CHAT_ID supports multiple destinations),
+# anything else is a compiled pattern the value must match
+_ENV_SCHEMA = {
+    'TELEGRAM_BOT_TOKEN': re.compile(r'^\d+:[\w-]{30,}$'),
+    'TELEGRAM_CHAT_ID': int,
+    'FINNHUB_API_KEY': re.compile(r'^[a-z0-9]{20,}$'),
+}
+
+class EnvConfigError(Exception):
+    """Raised when environment variables are present but malformed."""
+
+def _validate_env(env):
+    """Check each credential against its schema, reporting all problems at once."""
+    problems = []
+    validated = {}
+    for var, rule in _ENV_SCHEMA.items():
+        value = env[var]
+        if rule is int:
+            # The bot splits this on commas, so validate every segment
+            parts = [p.strip() for p in value.split(',') if p.strip()]
+            try:
+                for part in parts:
+                    int(part)
+                if not parts:
+                    raise ValueError
+            except ValueError:
+                problems.append(f"{var} must be an integer or comma-separated integers, got {value!r}")
+                continue
+        elif not rule.match(value):
+            problems.append(f"{var} does not match the expected format")
+            continue
+        validated[var] = value
+    if problems:
+        raise EnvConfigError("; ".join(problems))
+    return validated
+
+# Credentials snapshotted once after validation; repeated runs in the
+# same process (CI retry loops) read this instead of os.environ, and
+# tests can invalidate with _ENV_CACHE.clear()
+_ENV_CACHE = {}
+
+def get_env(var):
+    """Read a validated credential from the one-time snapshot."""
+    return _ENV_CACHE.get(var)
+
 def test_bot():
     print("🧪 Testing VIP InvestBot...")
     print("=" * 50)
-    
-    # Check if environment variables are set
-    required_vars = ['TELEGRAM_BOT_TOKEN', 'TELEGRAM_CHAT_ID', 'FINNHUB_API_KEY']
-    missing_vars = []
-    
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
-    
+
+    # Check if environment variables are set - one pass over a single
+    # os.environ snapshot instead of a getenv call per variable
+    if not _ENV_CACHE:
+        env = os.environ
+        missing_vars = [var for var in REQUIRED_VARS if not env.get(var)]
+    else:
+        missing_vars = []
+
     if missing_vars:
         print("❌ Missing environment variables:")
         for var in missing_vars:
@@ -28,16 +78,38 @@ def test_bot():
         for var in missing_vars:
             print(f"   export {var}='your_value_here'")
         return False
-    
+
+    if not _ENV_CACHE:
+        try:
+            _ENV_CACHE.update(_validate_env(env))
+        except EnvConfigError as e:
+            print("❌ Invalid environment configuration:")
+            for problem in str(e).split("; "):
+                print(f"   - {problem}")
+            return False
+
     print("✅ All environment variables found!")
     print("\n🚀 Starting InvestBot test...")
-    
+
     try:
         # Load previous alerts
         load_sent_alerts()
-        
-        # Create bot instance
-        bot = VIPInvestBot()
+
+        # Create bot instance with the already-validated credentials
+        bot = VIPInvestBot(
+            token=get_env('TELEGRAM_BOT_TOKEN'),
+            chat_id=get_env('TELEGRAM_CHAT_ID'),
+            finnhub_key=get_env('FINNHUB_API_KEY')
+        )
+
+        # Fail fast if either API is unreachable, before the slow scan
+        health = bot.healthcheck()
+        finnhub_state = "ok" if health.finnhub_ok else "DOWN"
+        telegram_state = "ok" if health.telegram_ok else "DOWN"
+        print(f"🩺 Healthcheck: finnhub={finnhub_state}, telegram={telegram_state} ({health.latency_ms:.0f} ms)")
+        if not (health.finnhub_ok and health.telegram_ok):
+            print("❌ Healthcheck failed - fix credentials/connectivity before running the full scan")
+            return False
         
         # Run monitoring
         alerts_sent = bot.run_vip_monitoring()